@@ -1,44 +1,68 @@
 # docx_processor/gui.py
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, ttk, messagebox
-import sys
 import os
+import contextlib
+import queue
 import threading
-from docx_processor.processor import main as process_document
+from functools import partial
+from typing import Callable
+
+# Maximum number of lines kept in the log widget
+MAX_LOG_LINES = 5000
+# Interval between log queue polls, in milliseconds
+LOG_POLL_INTERVAL_MS = 50
 
 
 class TextRedirector:
-    """Redirects stdout to a text widget."""
+    """Redirects stdout to a queue drained by the GUI."""
 
-    def __init__(self, text_widget: scrolledtext.ScrolledText):
-        self.text_widget = text_widget
-        self.buffer = ""
+    def __init__(self, log_queue: "queue.Queue[str]"):
+        self.log_queue = log_queue
 
-    def write(self, string: str):
-        self.buffer += string
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.insert(tk.END, string)
-        self.text_widget.see(tk.END)
-        self.text_widget.config(state=tk.DISABLED)
+    def write(self, string: str) -> int:
+        self.log_queue.put(string)
+        return len(string)
 
     def flush(self):
         pass
 
 
 class DocxProcessorApp:
+    _INPUT_FILETYPES = (("Word Documents", "*.docx"), ("All Files", "*.*"))
+    _OUTPUT_FILETYPES = (
+        ("Excel Files", "*.xlsx"),
+        ("CSV Files", "*.csv"),
+        ("All Files", "*.*"),
+    )
+    _INPUT_EXTENSIONS = (".docx",)
+    _OUTPUT_EXTENSIONS = (".xlsx", ".csv")
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("DOCX Processor")
         self.root.geometry("800x600")
         self.root.minsize(600, 400)
 
-        self.input_file_path = tk.StringVar()
-        self.output_file_path = tk.StringVar()
         self.status_text = tk.StringVar(value="Ready")
+        self.show_log = tk.BooleanVar(value=True)
+
+        self.log_queue: queue.Queue[str] = queue.Queue()
+        self._clear_log_pending = False
+        self._closing = False
+        # Single persistent worker for document processing. Unlike
+        # ThreadPoolExecutor workers it is a daemon thread, so closing the
+        # window does not wait for a running document to finish.
+        self._jobs: queue.Queue[Callable[[], Callable[[], str]]] = queue.Queue()
+        threading.Thread(target=self._work, daemon=True).start()
 
         self._create_widgets()
         self._setup_layout()
 
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self.root.after(LOG_POLL_INTERVAL_MS, self._poll_log_queue)
+
     def _create_widgets(self):
         # Frame for file selection
         self.file_frame = ttk.LabelFrame(self.root, text="File Selection")
@@ -47,9 +71,9 @@ class DocxProcessorApp:
         ttk.Label(self.file_frame, text="Input DOCX File:").grid(
             row=0, column=0, sticky=tk.W, padx=5, pady=5
         )
-        ttk.Entry(self.file_frame, textvariable=self.input_file_path, width=50).grid(
-            row=0, column=1, padx=5, pady=5
-        )
+        # Entries are read directly on submit rather than mirrored into StringVars
+        self.input_entry = ttk.Entry(self.file_frame, width=50)
+        self.input_entry.grid(row=0, column=1, padx=5, pady=5)
         ttk.Button(
             self.file_frame, text="Browse...", command=self._browse_input_file
         ).grid(row=0, column=2, padx=5, pady=5)
@@ -58,9 +82,8 @@ class DocxProcessorApp:
         ttk.Label(self.file_frame, text="Output File:").grid(
             row=1, column=0, sticky=tk.W, padx=5, pady=5
         )
-        ttk.Entry(self.file_frame, textvariable=self.output_file_path, width=50).grid(
-            row=1, column=1, padx=5, pady=5
-        )
+        self.output_entry = ttk.Entry(self.file_frame, width=50)
+        self.output_entry.grid(row=1, column=1, padx=5, pady=5)
         ttk.Button(
             self.file_frame, text="Browse...", command=self._browse_output_file
         ).grid(row=1, column=2, padx=5, pady=5)
@@ -80,13 +103,24 @@ class DocxProcessorApp:
         )
         self.clear_log_button.pack(side=tk.LEFT, padx=5)
 
+        # Show log checkbox
+        ttk.Checkbutton(button_frame, text="Show Log", variable=self.show_log).pack(
+            side=tk.LEFT, padx=5
+        )
+
         # Log area
         log_frame = ttk.LabelFrame(self.root, text="Log")
         self.log_text = scrolledtext.ScrolledText(
-            log_frame, wrap=tk.WORD, width=80, height=20
+            log_frame,
+            wrap=tk.WORD,
+            width=80,
+            height=20,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            state=tk.DISABLED,
         )
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.log_text.config(state=tk.DISABLED)
 
         # Status bar
         status_bar = ttk.Frame(self.root)
@@ -115,50 +149,54 @@ class DocxProcessorApp:
     def _browse_input_file(self):
         file_path = filedialog.askopenfilename(
             title="Select DOCX File",
-            filetypes=[("Word Documents", "*.docx"), ("All Files", "*.*")],
+            filetypes=self._INPUT_FILETYPES,
         )
         if file_path:
-            self.input_file_path.set(file_path)
+            self._set_entry(self.input_entry, file_path)
             # Set default output path
-            if not self.output_file_path.get():
+            if not self.output_entry.get():
                 base_name = os.path.splitext(os.path.basename(file_path))[0]
                 output_path = os.path.join(
                     os.path.dirname(file_path), f"{base_name}_processed.xlsx"
                 )
-                self.output_file_path.set(output_path)
+                self._set_entry(self.output_entry, output_path)
 
     def _browse_output_file(self):
         file_path = filedialog.asksaveasfilename(
             title="Save Output File",
             defaultextension=".xlsx",
-            filetypes=[
-                ("Excel Files", "*.xlsx"),
-                ("CSV Files", "*.csv"),
-                ("All Files", "*.*"),
-            ],
+            filetypes=self._OUTPUT_FILETYPES,
         )
         if file_path:
-            self.output_file_path.set(file_path)
+            self._set_entry(self.output_entry, file_path)
+
+    def _set_entry(self, entry: ttk.Entry, text: str):
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
 
     def _clear_log(self):
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        # Drop queued output and let the next drain replace the widget content
+        try:
+            while True:
+                self.log_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._clear_log_pending = True
 
     def _process_document(self):
-        input_path = self.input_file_path.get()
-        output_path = self.output_file_path.get()
+        input_path = self.input_entry.get()
+        output_path = self.output_entry.get()
 
         if not input_path or not output_path:
             messagebox.showerror("Error", "Please select both input and output files.")
             return
 
         # Validate file extensions
-        if not input_path.lower().endswith(".docx"):
+        if not input_path.lower().endswith(self._INPUT_EXTENSIONS):
             messagebox.showerror("Error", "Input file must be a .docx file.")
             return
 
-        if not output_path.lower().endswith((".xlsx", ".csv")):
+        if not output_path.lower().endswith(self._OUTPUT_EXTENSIONS):
             messagebox.showerror("Error", "Output file must be an .xlsx or .csv file.")
             return
 
@@ -167,53 +205,106 @@ class DocxProcessorApp:
         self.status_text.set("Processing...")
         self.progress_bar.start(10)
 
-        # Clear the log
+        # Clear the log; the first batch of output replaces the old content
         self._clear_log()
 
-        # Run processing in a separate thread to keep the UI responsive
-        threading.Thread(
-            target=self._run_processing, args=(input_path, output_path), daemon=True
-        ).start()
-
-    def _run_processing(self, input_path, output_path):
-        # Redirect stdout to the log text widget
-        original_stdout = sys.stdout
-        sys.stdout = TextRedirector(self.log_text)
+        # Run processing on the worker thread to keep the UI responsive
+        self._jobs.put(
+            partial(self._run_processing, input_path, output_path, self.show_log.get())
+        )
 
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            self._on_done(job())
+
+    def _run_processing(self, input_path: str, output_path: str, show_log: bool):
+        # Send everything printed while processing to the log queue, or leave
+        # stdout alone when the log is hidden
+        if show_log:
+            redirect = contextlib.redirect_stdout(TextRedirector(self.log_queue))
+        else:
+            redirect = contextlib.nullcontext()
+
+        with redirect:
+            try:
+                # Imported here so the window opens before lxml/openpyxl/pydantic load
+                from docx_processor.processor import main as process_document
+
+                # Process the document
+                result = process_document(input_path, output_path)
+
+                if result == 0:
+                    final_status = "Document processed successfully!"
+                    notify = partial(messagebox.showinfo, "Success", final_status)
+                else:
+                    final_status = f"Document processing failed with code: {result}"
+                    notify = partial(messagebox.showerror, "Error", final_status)
+
+                print(f"\n{final_status}")
+
+            except Exception as e:
+                error_message = f"Error during processing: {e}"
+                print(f"\n{error_message}")
+                notify = partial(messagebox.showerror, "Error", error_message)
+
+        return notify
+
+    def _on_done(self, notify: Callable[[], str]):
+        # The window is gone; there is no UI left to update
+        if self._closing:
+            return
         try:
-            # Process the document
-            result = process_document(input_path, output_path)
-
-            if result == 0:
-                final_status = "Document processed successfully!"
-                self.root.after(0, lambda: messagebox.showinfo("Success", final_status))
-            else:
-                final_status = f"Document processing failed with code: {result}"
-                self.root.after(0, lambda: messagebox.showerror("Error", final_status))
-
-            self._log(f"\n{final_status}")
-
-        except Exception as e:
-            error_message = f"Error during processing: {str(e)}"
-            self._log(f"\n{error_message}")
-            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
-        finally:
-            # Restore stdout
-            sys.stdout = original_stdout
+            # Re-enable UI elements before the modal result dialog blocks the loop
+            self.root.after(0, self._reset_ui)
+            self.root.after_idle(notify)
+        except (RuntimeError, tk.TclError):
+            # The window closed between the check above and these calls
+            pass
 
-            # Re-enable UI elements
-            self.root.after(0, lambda: self._reset_ui())
+    def _on_close(self):
+        self._closing = True
+        self.root.destroy()
 
     def _reset_ui(self):
+        # Show the final status lines right away instead of on the next poll
+        self._drain_log_queue()
         self.process_button.config(state=tk.NORMAL)
         self.status_text.set("Ready")
         self.progress_bar.stop()
 
-    def _log(self, message: str):
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+    def _poll_log_queue(self):
+        self._drain_log_queue()
+        self.root.after(LOG_POLL_INTERVAL_MS, self._poll_log_queue)
+
+    def _drain_log_queue(self):
+        chunks: list[str] = []
+        append = chunks.append
+        get_nowait = self.log_queue.get_nowait
+        try:
+            while True:
+                append(get_nowait())
+        except queue.Empty:
+            pass
+
+        if chunks or self._clear_log_pending:
+            log_text = self.log_text
+            text = "".join(chunks)
+            # The log is read-only; unlock it once per batch, not per line
+            log_text.config(state=tk.NORMAL)
+            if self._clear_log_pending:
+                log_text.replace("1.0", tk.END, text)
+                self._clear_log_pending = False
+            else:
+                log_text.insert(tk.END, text)
+
+            # Drop the oldest lines in a single range delete once over the cap
+            line_count = int(log_text.index("end-1c").split(".")[0])
+            if line_count > MAX_LOG_LINES:
+                log_text.delete("1.0", f"{line_count - MAX_LOG_LINES + 1}.0")
+
+            log_text.config(state=tk.DISABLED)
+            log_text.see(tk.END)
 
 
 def run():
@@ -1,10 +1,16 @@
-from typing import Callable, List, Dict, Tuple
-import pandas as pd
+from typing import Callable, List, Tuple
+from dataclasses import dataclass
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import Cell as ExcelCell
+from openpyxl.styles import Alignment, Border, Font, Side
 import zipfile
 from lxml import etree
 import functools as ft
 from pydantic import BaseModel, field_validator, Field
 import os
+import re
+import csv
 
 
 # Basic type definitions
@@ -13,6 +19,11 @@ Row = List[Cell]
 Table = List[Row]
 Document = List[Table]
 
+# WordprocessingML namespace and qualified tag names
+NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+W = "{" + NS["w"] + "}"
+TBL, TR, TC, T = W + "tbl", W + "tr", W + "tc", W + "t"
+
 
 # Custom exception classes
 class DocumentProcessingError(Exception):
@@ -48,6 +59,13 @@ class TransactionRowParsingConfig(BaseModel):
         default_factory=lambda: lambda s: s.isdigit(),
         description="Function to identify ID field in transaction",
     )
+    id_pattern: re.Pattern[str] | None = Field(
+        None,
+        description=(
+            "Regex with counterparty, ID and description groups; "
+            "used instead of id_test_func when set"
+        ),
+    )
 
     class Config:
         arbitrary_types_allowed = True
@@ -99,73 +117,63 @@ class OutputDocumentFormat(BaseModel):
             if not v.endswith((".xlsx", ".csv")):
                 raise ValueError(f"Output file '{v}' must be .xlsx or .csv")
         except Exception as e:
-            raise ValueError(f"Invalid output path: {str(e)}")
+            raise ValueError(f"Invalid output path: {e}")
         return v
 
 
-class LoadingConfig(BaseModel):
+# Strategy wiring; plain dataclasses as there is nothing for pydantic to validate
+@dataclass(frozen=True, slots=True)
+class LoadingConfig:
     loading_strategy: Callable[[InputDocumentFormat], Document]
     table_choose_strategy: Callable[[Document, InputDocumentFormat], Table]
     document_format: InputDocumentFormat
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
-class ProcessingConfiguration(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ProcessingConfiguration:
     header_processing_strategy: Callable[[Table, TableFormat], List[Row]]
     footer_processing_strategy: Callable[[Table, TableFormat], List[Row]]
     detail_row_processing_strategy: Callable[[Row, TableFormat], Row]
     transaction_row_processing_strategy: Callable[[Row, TableFormat], Row]
     combine_rows_strategy: Callable[[Row, Row, TableFormat], Row]
     table_format: TableFormat
-
-    class Config:
-        arbitrary_types_allowed = True
+    # Detail row cells the detail row strategy reads, checked once per table;
+    # None means the account, debit, and credit cells
+    detail_cell_indices: Tuple[int, ...] | None = None
 
 
-class ExportConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ExportConfig:
     export_strategy: Callable[[Table, OutputDocumentFormat], None]
     output_document_format: OutputDocumentFormat
 
-    class Config:
-        arbitrary_types_allowed = True
 
-
-def load_xml_table(table_element: etree._Element, namespaces: Dict[str, str]) -> Table:  # type: ignore
+def load_xml_table(table_element: etree._Element) -> Table:  # type: ignore
     """
     Extract table data from XML element.
 
     Args:
         table_element: XML element representing a table
-        namespaces: XML namespaces
 
     Returns:
         Extracted table as list of rows
-
-    Raises:
-        TableProcessingError: If XML parsing fails
     """
-    try:
-        table: Table = []
-        row_elements = table_element.xpath(".//w:tr", namespaces=namespaces)
-
-        for row_element in row_elements:
-            row: Row = []
-            for cell_element in row_element.xpath(".//w:tc", namespaces=namespaces):
-                text = " ".join(
-                    [
-                        t.text or ""  # Handle None values
-                        for t in cell_element.xpath(".//w:t", namespaces=namespaces)
-                        if t.text and t.text.strip()
-                    ]
-                )
-                row.append(text)
-            if row:  # Only add non-empty rows
-                table.append(row)
-        return table
-    except Exception as e:
-        raise TableProcessingError(f"Failed to extract table from XML: {str(e)}")
+    table: Table = []
+    # Element.iter walks descendants in C, matching the .//w:x semantics
+    for row_element in table_element.iter(TR):
+        row: Row = []
+        for cell_element in row_element.iter(TC):
+            parts: List[str] = []
+            append_part = parts.append
+            for text_element in cell_element.iter(T):
+                text = text_element.text
+                # Skip empty and whitespace-only runs
+                if text and not text.isspace():
+                    append_part(text)
+            row.append(" ".join(parts))
+        if row:  # Only add non-empty rows
+            table.append(row)
+    return table
 
 
 def load_xml_document(input_document_format: InputDocumentFormat) -> Document:
@@ -183,24 +191,43 @@ def load_xml_document(input_document_format: InputDocumentFormat) -> Document:
     """
     docx_path = input_document_format.path
     try:
-        with zipfile.ZipFile(docx_path) as zf:
-            xml_content = zf.read("word/document.xml")
+        tables: Document = []
+        # Slots in `tables` reserved for tables that have started but not ended
+        open_tables: List[int] = []
 
-        # Parse the XML
-        root = etree.fromstring(xml_content)
-        namespaces = {
-            "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        }
+        # Stream the XML so only the tables still being read are kept in memory
+        with zipfile.ZipFile(docx_path) as zf:
+            with zf.open("word/document.xml") as xml_file:
+                # Parser options: no ID hash, no whitespace-only text nodes
+                # (load_xml_table skips them anyway), no size limits for large
+                # exports, and no entity expansion
+                for event, table_element in etree.iterparse(
+                    xml_file,
+                    events=("start", "end"),
+                    tag=TBL,
+                    collect_ids=False,
+                    remove_blank_text=True,
+                    huge_tree=True,
+                    resolve_entities=False,
+                ):
+                    if event == "start":
+                        # Reserve the slot on start to keep document order
+                        open_tables.append(len(tables))
+                        tables.append([])
+                        continue
+
+                    tables[open_tables.pop()] = load_xml_table(table_element)
+
+                    if not open_tables:
+                        # Free the finished top-level table and everything before it
+                        table_element.clear(keep_tail=True)
+                        parent = table_element.getparent()
+                        if parent is not None:
+                            while table_element.getprevious() is not None:
+                                del parent[0]
 
-        # Find all tables
-        table_elements = root.xpath("//w:tbl", namespaces=namespaces)
-        if not table_elements:
+        if not tables:
             raise DocumentLoadingError("No tables found in document")
-
-        tables: Document = []
-        for table_element in table_elements:
-            table = load_xml_table(table_element, namespaces)
-            tables.append(table)
         return tables
     except zipfile.BadZipFile:
         raise DocumentLoadingError(f"'{docx_path}' is not a valid DOCX file")
@@ -209,9 +236,9 @@ def load_xml_document(input_document_format: InputDocumentFormat) -> Document:
             "Document structure error: word/document.xml not found"
         )
     except etree.XMLSyntaxError as e:
-        raise DocumentLoadingError(f"XML parsing error: {str(e)}")
+        raise DocumentLoadingError(f"XML parsing error: {e}")
     except Exception as e:
-        raise DocumentLoadingError(f"Failed to load document: {str(e)}")
+        raise DocumentLoadingError(f"Failed to load document: {e}")
 
 
 def choose_table(tables: Document, input_document_format: InputDocumentFormat) -> Table:
@@ -246,7 +273,7 @@ def choose_table(tables: Document, input_document_format: InputDocumentFormat) -
     except TableProcessingError:
         raise
     except Exception as e:
-        raise TableProcessingError(f"Error selecting table: {str(e)}")
+        raise TableProcessingError(f"Error selecting table: {e}")
 
 
 def empty_header(table: Table, table_format: TableFormat) -> List[Row]:
@@ -259,24 +286,41 @@ def empty_footer(table: Table, table_format: TableFormat) -> List[Row]:
     return []
 
 
-def validate_row_index(row: Row, index: int, function_name: str) -> None:
+def validate_table_format(
+    detail_rows: Table,
+    table_format: TableFormat,
+    first_row: int,
+    cell_indices: Tuple[int, ...] | None = None,
+) -> None:
     """
-    Validate that a row has enough elements to access the given index.
+    Validate that every detail row has the cells the detail row strategy reads.
 
     Args:
-        row: The row to validate
-        index: The index to access
-        function_name: Name of the calling function for error reporting
+        detail_rows: Detail rows of the table
+        table_format: Table format configuration
+        first_row: Table index of the first detail row, for error reporting
+        cell_indices: Cells to check; defaults to the account, debit, and
+            credit cells
 
     Raises:
-        TableProcessingError: If index is out of range
+        TableProcessingError: If a detail row is too short
     """
-    if not row:
-        raise TableProcessingError(f"{function_name}: Row is empty")
-    if index < 0 or index >= len(row):
-        raise TableProcessingError(
-            f"{function_name}: Index {index} out of range (0-{len(row) - 1})"
+    if cell_indices is None:
+        cell_indices = (
+            table_format.account_cell_index,
+            table_format.debit_cell_index,
+            table_format.credit_cell_index,
         )
+    if not cell_indices:
+        return
+
+    max_index = max(cell_indices)
+    for i, row in enumerate(detail_rows):
+        if len(row) <= max_index:
+            raise TableProcessingError(
+                f"Detail row {first_row + 2 * i} has {len(row)} cells, "
+                f"needs at least {max_index + 1}"
+            )
 
 
 def process_detail_row_and_process_account(
@@ -287,6 +331,11 @@ def process_detail_row_and_process_account(
     """
     Process a detail row by applying a function to the account cell.
 
+    The cell index is expected to have been checked once per table with
+    validate_table_format. Configurations using this strategy should set
+    detail_cell_indices to the account cell alone, so rows without debit and
+    credit cells pass that check.
+
     Args:
         row: The detail row
         table_format: Table format configuration
@@ -296,26 +345,14 @@ def process_detail_row_and_process_account(
         Processed row
 
     Raises:
-        TableProcessingError: If row processing fails
+        ValueError: If the cell function rejects the account value
     """
-    try:
-        # Make a copy to avoid modifying the original
-        row_copy = row.copy()
-
-        validate_row_index(
-            row_copy,
-            table_format.account_cell_index,
-            "process_detail_row_and_process_account",
-        )
+    account_index = table_format.account_cell_index
 
-        row_copy[table_format.account_cell_index] = process_func(
-            row_copy[table_format.account_cell_index]
-        )
-        return row_copy
-    except TableProcessingError:
-        raise
-    except Exception as e:
-        raise TableProcessingError(f"Error processing detail row: {str(e)}")
+    # Make a copy to avoid modifying the original
+    row_copy = row.copy()
+    row_copy[account_index] = process_func(row[account_index])
+    return row_copy
 
 
 def process_detail_row_and_process_account_debit_credit(
@@ -328,6 +365,9 @@ def process_detail_row_and_process_account_debit_credit(
     """
     Process a detail row by applying functions to the account, debit, and credit cells.
 
+    Cell indices are expected to have been checked once per table with
+    validate_table_format.
+
     Args:
         row: The detail row
         table_format: Table format configuration
@@ -339,43 +379,67 @@ def process_detail_row_and_process_account_debit_credit(
         Processed row
 
     Raises:
-        TableProcessingError: If row processing fails
+        ValueError: If a cell function rejects its value
     """
-    try:
-        # Make a copy to avoid modifying the original
-        row_copy = row.copy()
+    account_index = table_format.account_cell_index
+    debit_index = table_format.debit_cell_index
+    credit_index = table_format.credit_cell_index
 
-        validate_row_index(
-            row_copy,
-            table_format.account_cell_index,
-            "process_detail_row_and_process_account_debit_credit",
-        )
-        validate_row_index(
-            row_copy,
-            table_format.debit_cell_index,
-            "process_detail_row_and_process_account_debit_credit",
-        )
-        validate_row_index(
-            row_copy,
-            table_format.credit_cell_index,
-            "process_detail_row_and_process_account_debit_credit",
-        )
+    # Make a copy to avoid modifying the original
+    row_copy = row.copy()
+    row_copy[account_index] = process_account_func(row[account_index])
+    row_copy[debit_index] = process_debit_func(row[debit_index])
+    row_copy[credit_index] = process_credit_func(row[credit_index])
+    return row_copy
 
-        row_copy[table_format.account_cell_index] = process_account_func(
-            row_copy[table_format.account_cell_index]
-        )
-        row_copy[table_format.debit_cell_index] = process_debit_func(
-            row_copy[table_format.debit_cell_index]
-        )
-        row_copy[table_format.credit_cell_index] = process_credit_func(
-            row_copy[table_format.credit_cell_index]
-        )
 
+def make_detail_row_processor(
+    table_format: TableFormat,
+    process_account_func: Callable[[Cell], Cell],
+    process_debit_func: Callable[[Cell], Cell],
+    process_credit_func: Callable[[Cell], Cell],
+) -> Callable[[Row, TableFormat], Row]:
+    """
+    Build a detail row strategy specialized for the given cell indices.
+
+    The indices and cell functions are bound once, so each call skips the
+    table format lookups and keyword argument handling. The strategy rejects
+    a table format whose cell indices differ from the ones it was built for.
+
+    Args:
+        table_format: Table format configuration
+        process_account_func: Function to apply to the account cell
+        process_debit_func: Function to apply to the debit cell
+        process_credit_func: Function to apply to the credit cell
+
+    Returns:
+        Detail row processing strategy
+    """
+    bound_format = table_format
+    account_index = table_format.account_cell_index
+    debit_index = table_format.debit_cell_index
+    credit_index = table_format.credit_cell_index
+
+    def process_detail_row(row: Row, table_format: TableFormat) -> Row:
+        # The identity check keeps the usual call cheap
+        if table_format is not bound_format and (
+            table_format.account_cell_index != account_index
+            or table_format.debit_cell_index != debit_index
+            or table_format.credit_cell_index != credit_index
+        ):
+            raise TableProcessingError(
+                "Detail row processor was built for different cell indices"
+            )
+
+        # Same cell handling as process_detail_row_and_process_account_debit_credit,
+        # kept inline so the per-row call stays a single frame
+        row_copy = row.copy()
+        row_copy[account_index] = process_account_func(row[account_index])
+        row_copy[debit_index] = process_debit_func(row[debit_index])
+        row_copy[credit_index] = process_credit_func(row[credit_index])
         return row_copy
-    except TableProcessingError:
-        raise
-    except Exception as e:
-        raise TableProcessingError(f"Error processing detail row: {str(e)}")
+
+    return process_detail_row
 
 
 def parse_transaction_description(
@@ -393,42 +457,50 @@ def parse_transaction_description(
         Parsed transaction parts
 
     Raises:
-        TableProcessingError: If row processing fails
+        TableProcessingError: If no ID is found in the description
     """
-    try:
-        config = table_format.transaction_row_parsing_config
+    config = table_format.transaction_row_parsing_config
+
+    if not row:
+        return [""] * config.field_count
 
-        if not row:
-            return [""] * config.field_count
+    if len(row) == 0 or not row[0]:
+        return [""] * config.field_count
 
-        if len(row) == 0 or not row[0]:
-            return [""] * config.field_count
+    if not isinstance(row[0], str):
+        raise TableProcessingError(
+            f"Expected string in row[0], got {type(row[0]).__name__}"
+        )
 
-        if not isinstance(row[0], str):
-            raise TableProcessingError(
-                f"Expected string in row[0], got {type(row[0]).__name__}"
-            )
+    result: Row = [""] * config.field_count
 
-        text = row[0].split(" ")
-        result: Row = [""] * config.field_count
-
-        # Try to find ID and split fields accordingly
-        id_found = False
-        for i, word in enumerate(text):
-            word = word.strip()
-            if config.id_test_func(word):
-                result[0] = " ".join(text[:i]).strip()  # Counterparty
-                result[1] = word  # ID
-                result[2] = " ".join(text[i + 1 :]).strip()  # Description
-                id_found = True
-                break
-
-        if not id_found:
+    # Split with a single regex match when a pattern is configured
+    if config.id_pattern is not None:
+        match = config.id_pattern.match(row[0])
+        if match is None:
             raise TableProcessingError("ID not found in transaction description")
-
+        result[0] = match.group(1).strip()  # Counterparty
+        result[1] = match.group(2)  # ID
+        result[2] = match.group(3).strip()  # Description
         return result
-    except Exception as e:
-        raise TableProcessingError(f"Error parsing transaction description: {str(e)}")
+
+    text = row[0].split(" ")
+
+    # Try to find ID and split fields accordingly
+    id_found = False
+    for i, word in enumerate(text):
+        word = word.strip()
+        if config.id_test_func(word):
+            result[0] = " ".join(text[:i]).strip()  # Counterparty
+            result[1] = word  # ID
+            result[2] = " ".join(text[i + 1 :]).strip()  # Description
+            id_found = True
+            break
+
+    if not id_found:
+        raise TableProcessingError("ID not found in transaction description")
+
+    return result
 
 
 def combine_rows(
@@ -448,16 +520,11 @@ def combine_rows(
     Raises:
         TableProcessingError: If row combining fails
     """
-    try:
-        if not detail_row:
-            raise TableProcessingError("Detail row is empty")
-        if not transaction_row:
-            raise TableProcessingError("Transaction row is empty")
-        return detail_row + transaction_row
-    except TableProcessingError:
-        raise
-    except Exception as e:
-        raise TableProcessingError(f"Error combining rows: {str(e)}")
+    if not detail_row:
+        raise TableProcessingError("Detail row is empty")
+    if not transaction_row:
+        raise TableProcessingError("Transaction row is empty")
+    return detail_row + transaction_row
 
 
 def extract_transactions(config: ProcessingConfiguration, table: Table) -> Table:
@@ -478,8 +545,9 @@ def extract_transactions(config: ProcessingConfiguration, table: Table) -> Table
         if not table:
             raise TableProcessingError("Table is empty")
 
-        header_len = config.table_format.header_len
-        footer_len = config.table_format.footer_len
+        table_format = config.table_format
+        header_len = table_format.header_len
+        footer_len = table_format.footer_len
 
         # Validate that the table has enough rows
         min_rows = header_len + footer_len
@@ -488,45 +556,71 @@ def extract_transactions(config: ProcessingConfiguration, table: Table) -> Table
                 f"Table has {len(table)} rows, needs at least {min_rows} rows"
             )
 
-        header = config.header_processing_strategy(table, config.table_format)
-        footer = config.footer_processing_strategy(table, config.table_format)
+        header = config.header_processing_strategy(table, table_format)
+        footer = config.footer_processing_strategy(table, table_format)
 
         table_start = header_len
         table_end = len(table) - footer_len
 
+        # Detail rows alternate with their transaction rows; slicing both
+        # sequences up front replaces per-iteration index arithmetic. Both
+        # slices stop at the end of the last full pair, so a trailing unpaired
+        # row is left out and an empty body never wraps around to the end.
+        pairs_end = table_start + (table_end - table_start) // 2 * 2
+        detail_rows = table[table_start:pairs_end:2]
+        transaction_rows = table[table_start + 1 : pairs_end : 2]
+
+        # Check cell indices once per table instead of once per row
+        validate_table_format(
+            detail_rows, table_format, table_start, config.detail_cell_indices
+        )
+
+        # Resolve the strategies once rather than on every iteration
+        process_detail_row = config.detail_row_processing_strategy
+        process_transaction_row = config.transaction_row_processing_strategy
+        combine = config.combine_rows_strategy
+
         transactions: Table = []
+        append_transaction = transactions.append
+        # The row helpers raise naturally; one handler around the whole loop
+        # reports the failing row pair from the loop index.
         i = table_start
-        while i < table_end - 1:
-            try:
+        try:
+            for i, detail_row, transaction_row in zip(
+                range(table_start, table_end, 2), detail_rows, transaction_rows
+            ):
                 # Process the detail row
-                detail_row = config.detail_row_processing_strategy(
-                    table[i], config.table_format
-                )
+                detail_row = process_detail_row(detail_row, table_format)
 
                 # Process the transaction row
-                transaction_row = config.transaction_row_processing_strategy(
-                    table[i + 1], config.table_format
-                )
+                transaction_row = process_transaction_row(transaction_row, table_format)
 
                 # Combine the rows
-                combined_row = config.combine_rows_strategy(
-                    detail_row, transaction_row, config.table_format
-                )
-
-                transactions.append(combined_row)
-                i += 2  # Move to next transaction pair
-            except IndexError:
-                raise TableProcessingError(f"Index error at row {i}/{len(table)}")
-            except Exception as e:
-                raise TableProcessingError(
-                    f"Error processing rows {i}-{i + 1}: {str(e)}"
-                )
-
-        return header + transactions + footer
+                append_transaction(combine(detail_row, transaction_row, table_format))
+        except IndexError:
+            raise TableProcessingError(f"Index error at row {i}/{len(table)}")
+        except Exception as e:
+            raise TableProcessingError(f"Error processing rows {i}-{i + 1}: {e}")
+
+        # The default header/footer strategies return nothing; skip the copy then
+        if not header and not footer:
+            return transactions
+        return [*header, *transactions, *footer]
     except TableProcessingError:
         raise
     except Exception as e:
-        raise TableProcessingError(f"Error extracting transactions: {str(e)}")
+        raise TableProcessingError(f"Error extracting transactions: {e}")
+
+
+# Header style matching what pandas.DataFrame.to_excel used to produce
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(
+    left=Side(style="thin"),
+    right=Side(style="thin"),
+    top=Side(style="thin"),
+    bottom=Side(style="thin"),
+)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
 
 
 def export_to_excel(table: Table, output_document_format: OutputDocumentFormat) -> None:
@@ -551,12 +645,26 @@ def export_to_excel(table: Table, output_document_format: OutputDocumentFormat)
                 f"column names were provided"
             )
 
-        df = pd.DataFrame(table, columns=output_document_format.columns)
-        df.to_excel(output_document_format.path, index=False)  # type: ignore
+        # Stream rows straight into a write-only workbook
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Sheet1")
+
+        header: List[ExcelCell] = []
+        for column in output_document_format.columns:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.font = _HEADER_FONT
+            cell.border = _HEADER_BORDER
+            cell.alignment = _HEADER_ALIGNMENT
+            header.append(cell)
+        worksheet.append(header)
+
+        for row in table:
+            worksheet.append(row)
+        workbook.save(output_document_format.path)
     except ExportError:
         raise
     except Exception as e:
-        raise ExportError(f"Failed to export to Excel: {str(e)}")
+        raise ExportError(f"Failed to export to Excel: {e}")
 
 
 def export_to_csv(table: Table, output_document_format: OutputDocumentFormat) -> None:
@@ -581,12 +689,18 @@ def export_to_csv(table: Table, output_document_format: OutputDocumentFormat) ->
                 f"column names were provided"
             )
 
-        df = pd.DataFrame(table, columns=output_document_format.columns)
-        df.to_csv(output_document_format.path, index=False)  # type: ignore
+        # Stream rows through the csv module; the line terminator follows the
+        # platform convention, as pandas.DataFrame.to_csv did
+        with open(
+            output_document_format.path, "w", newline="", encoding="utf-8"
+        ) as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(output_document_format.columns)
+            writer.writerows(table)
     except ExportError:
         raise
     except Exception as e:
-        raise ExportError(f"Failed to export to CSV: {str(e)}")
+        raise ExportError(f"Failed to export to CSV: {e}")
 
 
 def replace_whitespace(text: Cell) -> Cell:
@@ -596,21 +710,88 @@ def replace_whitespace(text: Cell) -> Cell:
     return text.replace(" ", "")
 
 
+# Strips spaces and turns decimal commas into points in a single pass
+_FLOAT_TRANSLATION = str.maketrans({" ": "", ",": "."})
+
+
 def convert_to_float(text: Cell) -> Cell:
     """Convert text to float."""
+    # Empty cells are common (one of debit/credit is usually blank)
+    if not text:
+        return 0.0
     try:
         if not isinstance(text, str):
             raise ValueError(f"Expected string, got {type(text).__name__}")
-        if not text:
-            return 0.0
-        text = text.replace(" ", "").replace(",", ".")
-        return float(text)
+        return float(text.translate(_FLOAT_TRANSLATION))
     except ValueError:
         raise ValueError(f"Cannot convert '{text}' to float")
 
 
-def test_transaction_id(word: str) -> bool:
-    return word.isdigit() and len(word) == 9
+# Transaction description split at the first space-delimited token that is
+# exactly nine decimal digits once stripped of other whitespace. This is the
+# only encoding of the ID rule in the default configuration; \d matches what
+# str.isdecimal accepts, not the wider str.isdigit set.
+TRANSACTION_DESCRIPTION_PATTERN = re.compile(
+    r"^(.*?)(?<![^ ])[^\S ]*(\d{9})[^\S ]*(?![^ ])(.*)$", re.DOTALL
+)
+
+
+@ft.lru_cache(maxsize=1)
+def _static_configuration() -> Tuple[ProcessingConfiguration, Tuple[str, ...]]:
+    """
+    Build the parts of the configuration that do not depend on file paths.
+
+    The result is cached, so the models are validated once per process.
+
+    Returns:
+        Tuple of (processing_config, output_columns)
+    """
+    # Transaction row parsing configuration
+    transaction_row_parsing_config = TransactionRowParsingConfig(
+        field_count=3,
+        id_pattern=TRANSACTION_DESCRIPTION_PATTERN,
+    )
+
+    # Table format
+    table_format = TableFormat(
+        header_len=3,
+        footer_len=2,
+        account_cell_index=4,
+        debit_cell_index=5,
+        credit_cell_index=6,
+        transaction_row_parsing_config=transaction_row_parsing_config,
+    )
+
+    # Processing configuration
+    processing_config = ProcessingConfiguration(
+        header_processing_strategy=empty_header,
+        footer_processing_strategy=empty_footer,
+        detail_row_processing_strategy=make_detail_row_processor(
+            table_format,
+            process_account_func=replace_whitespace,
+            process_debit_func=convert_to_float,
+            process_credit_func=convert_to_float,
+        ),
+        transaction_row_processing_strategy=parse_transaction_description,
+        combine_rows_strategy=combine_rows,
+        table_format=table_format,
+    )
+
+    # Output columns
+    output_columns = (
+        "Дата и время совершения текущей операции",
+        "№ док.",
+        "Код опер",
+        "Код",
+        "Счет",
+        "Дебет",
+        "Кредит",
+        "Контрагент",
+        "УНП",
+        "Назначение",
+    )
+
+    return processing_config, output_columns
 
 
 def setup_configuration(
@@ -630,21 +811,7 @@ def setup_configuration(
         ValueError: If configuration setup fails
     """
     try:
-        # Transaction row parsing configuration
-        transaction_row_parsing_config = TransactionRowParsingConfig(
-            field_count=3,
-            id_test_func=test_transaction_id,
-        )
-
-        # Table format
-        table_format = TableFormat(
-            header_len=3,
-            footer_len=2,
-            account_cell_index=4,
-            debit_cell_index=5,
-            credit_cell_index=6,
-            transaction_row_parsing_config=transaction_row_parsing_config,
-        )
+        processing_config, output_columns = _static_configuration()
 
         # Input document format
         document_format = InputDocumentFormat(table_index=2, path=input_path)
@@ -656,36 +823,10 @@ def setup_configuration(
             document_format=document_format,
         )
 
-        # Processing configuration
-        processing_config = ProcessingConfiguration(
-            header_processing_strategy=empty_header,
-            footer_processing_strategy=empty_footer,
-            detail_row_processing_strategy=ft.partial(
-                process_detail_row_and_process_account_debit_credit,
-                process_account_func=replace_whitespace,
-                process_debit_func=convert_to_float,
-                process_credit_func=convert_to_float,
-            ),
-            transaction_row_processing_strategy=parse_transaction_description,
-            combine_rows_strategy=combine_rows,
-            table_format=table_format,
-        )
-
         # Output format
         output_document_format = OutputDocumentFormat(
             path=output_path,
-            columns=[
-                "Дата и время совершения текущей операции",
-                "№ док.",
-                "Код опер",
-                "Код",
-                "Счет",
-                "Дебет",
-                "Кредит",
-                "Контрагент",
-                "УНП",
-                "Назначение",
-            ],
+            columns=list(output_columns),
         )
 
         output_file_extension = os.path.splitext(output_path)[-1].lower()
@@ -706,7 +847,7 @@ def setup_configuration(
         return loading_config, processing_config, export_config
 
     except Exception as e:
-        raise ValueError(f"Error in configuration setup: {str(e)}")
+        raise ValueError(f"Error in configuration setup: {e}")
 
 
 def main(input_path: str = "vpsk.docx", output_path: str = "output.xlsx") -> int:
@@ -727,42 +868,39 @@ def main(input_path: str = "vpsk.docx", output_path: str = "output.xlsx") -> int
         )
 
         # Load the document
-        print(f"Loading document: {loading_config.document_format.path}")
-        document = loading_config.loading_strategy(loading_config.document_format)
+        document_format = loading_config.document_format
+        print(f"Loading document: {document_format.path}")
+        document = loading_config.loading_strategy(document_format)
 
         # Choose the table
-        print(f"Selecting table {loading_config.document_format.table_index}")
-        table = loading_config.table_choose_strategy(
-            document, loading_config.document_format
-        )
+        print(f"Selecting table {document_format.table_index}")
+        table = loading_config.table_choose_strategy(document, document_format)
 
         # Process the table
         print("Processing transactions...")
         transactions = extract_transactions(processing_config, table)
 
         # Export the result
-        print(f"Exporting to {export_config.output_document_format.path}")
-        export_config.export_strategy(
-            transactions, export_config.output_document_format
-        )
+        output_document_format = export_config.output_document_format
+        export_path = output_document_format.path
+        print(f"Exporting to {export_path}")
+        export_config.export_strategy(transactions, output_document_format)
 
-        print(
-            f"✓ Successfully processed document and exported to {export_config.output_document_format.path}"
-        )
+        print(f"✓ Successfully processed document and exported to {export_path}")
 
         return 0
 
     except DocumentLoadingError as e:
-        print(f"❌ Document loading error: {str(e)}")
+        print(f"❌ Document loading error: {e}")
         return 1
     except TableProcessingError as e:
-        print(f"❌ Table processing error: {str(e)}")
+        print(f"❌ Table processing error: {e}")
         return 1
     except ExportError as e:
-        print(f"❌ Export error: {str(e)}")
+        print(f"❌ Export error: {e}")
         return 1
     except Exception as e:
-        print(f"❌ Unexpected error: {str(e)}")
+        print(f"❌ Unexpected error: {e}")
         return 1
 
 